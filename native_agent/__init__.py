@@ -0,0 +1,5 @@
+"""Native agent utilities: market-data pipeline and LLM-backed helpers."""
+
+# kept here (rather than in providers.openai_provider) so light entry points
+# can read it without importing the openai stack
+DEFAULT_MODEL = "gpt-4o-mini"
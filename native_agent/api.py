@@ -0,0 +1,64 @@
+"""HTTP API over the message rewriter and the ETH analyzer."""
+
+from functools import lru_cache
+from typing import Optional
+
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from .pipeline.eth_analyzer import ETHPriceAnalyzer
+from .providers.batching import BatchingLLMProvider
+from .providers.openai_provider import DEFAULT_MODEL, OpenAIProvider
+from .rewriter import MessageRewriter, RewriteRequest
+
+app = FastAPI(title="native-agent")
+
+
+class RewriteBody(BaseModel):
+    text: str
+    style: str = "professional"
+    extra_instructions: Optional[str] = None
+    model: str = DEFAULT_MODEL
+
+
+# one batching provider per process: concurrent requests that land in the
+# same window are dispatched to OpenAI together
+@lru_cache(maxsize=1)
+def _get_provider() -> BatchingLLMProvider:
+    return BatchingLLMProvider(OpenAIProvider())
+
+
+# rewriters and analyzers hold no per-request state, so successive
+# requests reuse the same instance (and its provider's connection pool)
+@lru_cache(maxsize=8)
+def _get_rewriter(model: str) -> MessageRewriter:
+    return MessageRewriter(provider=_get_provider(), model=model)
+
+
+@lru_cache(maxsize=1)
+def _get_analyzer() -> ETHPriceAnalyzer:
+    return ETHPriceAnalyzer(provider=_get_provider())
+
+
+@app.post("/rewrite")
+async def rewrite(body: RewriteBody):
+    rewritten = await _get_rewriter(body.model).rewrite_async(
+        RewriteRequest(
+            text=body.text,
+            style=body.style,
+            extra_instructions=body.extra_instructions,
+        )
+    )
+    return {"rewritten": rewritten}
+
+
+@app.get("/analyze-eth")
+async def analyze_eth():
+    result = await _get_analyzer().analyze_async()
+    return {
+        "current_price": result.current_price,
+        "high": result.high,
+        "low": result.low,
+        "change_pct": result.change_pct,
+        "summary": result.summary,
+    }
@@ -0,0 +1,43 @@
+"""Command-line entry points for the rewriter and the ETH analyzer.
+
+The LLM stack (openai, httpx, pydantic) is imported inside the command
+bodies so short-lived invocations like ``--help`` don't pay for it.
+"""
+
+from typing import Optional
+
+import typer
+
+from . import DEFAULT_MODEL
+
+cli = typer.Typer(help="LLM-backed rewriting and ETH market analysis.")
+
+
+@cli.command()
+def rewrite(
+    text: str,
+    style: str = "professional",
+    extra_instructions: Optional[str] = None,
+    model: str = DEFAULT_MODEL,
+) -> None:
+    """Rewrite TEXT in the requested style."""
+    from .rewriter import MessageRewriter, RewriteRequest
+
+    rewriter = MessageRewriter(model=model)
+    typer.echo(
+        rewriter.rewrite(
+            RewriteRequest(text=text, style=style, extra_instructions=extra_instructions)
+        )
+    )
+
+
+@cli.command()
+def analyze_eth(model: str = DEFAULT_MODEL) -> None:
+    """Summarise recent ETH price action."""
+    from .pipeline.eth_analyzer import ETHPriceAnalyzer
+
+    typer.echo(ETHPriceAnalyzer(model=model).analyze().summary)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,3 @@
+from .coingecko import COINGECKO_BASE_URL, CoinGeckoETHDataSource, PricePoint, PriceSeries
+
+__all__ = ["COINGECKO_BASE_URL", "CoinGeckoETHDataSource", "PricePoint", "PriceSeries"]
@@ -0,0 +1,183 @@
+"""CoinGecko-backed price data source for the ETH analysis pipeline."""
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+import numpy as np
+import orjson
+from cachetools import TTLCache
+
+COINGECKO_BASE_URL = "https://api.coingecko.com/api/v3"
+
+# CoinGecko serves market_chart from an edge cache that refreshes roughly
+# every 20-60 seconds, so anything fresher than this is a guaranteed repeat.
+_CACHE_TTL_SECONDS = 20.0
+
+# One long-lived client so repeated polls reuse the TCP connection and TLS
+# session instead of paying ~2 RTTs of handshake per call; with HTTP/2 a
+# 304 revalidation rides an existing stream with compressed headers.
+_CLIENT = httpx.Client(http2=True, timeout=10.0, headers={"accept-encoding": "gzip"})
+
+_ASYNC_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Shared :class:`httpx.AsyncClient` for async callers, created lazily."""
+    global _ASYNC_CLIENT
+    if _ASYNC_CLIENT is None:
+        _ASYNC_CLIENT = httpx.AsyncClient(
+            http2=True, timeout=10.0, headers={"accept-encoding": "gzip"}
+        )
+    return _ASYNC_CLIENT
+
+
+_CacheKey = Tuple[int, str, str]
+
+# Shared across datasource instances so concurrent callers in one process
+# coalesce onto a single origin fetch per (days, interval, base_url).
+_SERIES_CACHE: "TTLCache[_CacheKey, PriceSeries]" = TTLCache(
+    maxsize=16, ttl=_CACHE_TTL_SECONDS
+)
+# Conditional-GET validators and the last parsed series outlive the TTL so
+# an expired entry revalidates with a 304 instead of re-parsing.
+_VALIDATORS: Dict[_CacheKey, Dict[str, Any]] = {}
+_LAST_SERIES: Dict[_CacheKey, "PriceSeries"] = {}
+_KEY_LOCKS: Dict[_CacheKey, threading.Lock] = {}
+_CACHE_GUARD = threading.Lock()
+
+
+def _key_lock(key: _CacheKey) -> threading.Lock:
+    with _CACHE_GUARD:
+        lock = _KEY_LOCKS.get(key)
+        if lock is None:
+            lock = _KEY_LOCKS[key] = threading.Lock()
+        return lock
+
+
+@dataclass(frozen=True)
+class PricePoint:
+    """A single observed price at a point in time.
+
+    This is a view for presentation; storage lives in :class:`PriceSeries`.
+    """
+
+    timestamp: datetime
+    price: float
+
+
+@dataclass(frozen=True)
+class PriceSeries:
+    """A window of observations as two parallel arrays.
+
+    Keeping timestamps (ms since epoch) and prices in NumPy arrays costs
+    16 bytes per observation instead of ~100 for a boxed dataclass, and
+    makes min/max/diff and slicing vectorised.
+    """
+
+    timestamps_ms: np.ndarray
+    prices: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def tail(self, n: int) -> List[PricePoint]:
+        """Materialise the last ``n`` observations as :class:`PricePoint`s."""
+        return [
+            PricePoint(
+                timestamp=datetime.fromtimestamp(ts / 1000, tz=timezone.utc),
+                price=price,
+            )
+            for ts, price in zip(
+                self.timestamps_ms[-n:].tolist(), self.prices[-n:].tolist()
+            )
+        ]
+
+
+class CoinGeckoETHDataSource:
+    """Fetches recent ETH/USD price points from CoinGecko's market_chart API.
+
+    Parsed series are cached in a process-wide TTL cache keyed on
+    ``(days, interval, base_url)``, with a per-key lock so concurrent
+    callers coalesce onto a single origin fetch. Expired entries are
+    revalidated with ``If-None-Match`` / ``If-Modified-Since``; a 304
+    reuses the previously parsed arrays without touching JSON.
+    """
+
+    def __init__(
+        self,
+        days: int = 1,
+        interval: str = "hourly",
+        base_url: str = COINGECKO_BASE_URL,
+        requester: Optional[Callable[..., httpx.Response]] = None,
+    ) -> None:
+        self._days = days
+        self._interval = interval
+        self._base_url = base_url
+        self._requester = requester if requester is not None else _CLIENT.get
+
+    def fetch_price_points(self) -> PriceSeries:
+        key = (self._days, self._interval, self._base_url)
+        with _CACHE_GUARD:
+            series = _SERIES_CACHE.get(key)
+        if series is not None:
+            return series
+
+        with _key_lock(key):
+            # double-checked: another caller may have fetched while we waited
+            with _CACHE_GUARD:
+                series = _SERIES_CACHE.get(key)
+            if series is not None:
+                return series
+            return self._fetch_origin(key)
+
+    def _fetch_origin(self, key: _CacheKey) -> PriceSeries:
+        headers = {}
+        validators = _VALIDATORS.get(key, {})
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+        response = self._requester(
+            f"{self._base_url}/coins/ethereum/market_chart",
+            params={
+                "vs_currency": "usd",
+                "days": self._days,
+                "interval": self._interval,
+            },
+            headers=headers,
+        )
+        stale = _LAST_SERIES.get(key)
+        if response.status_code == httpx.codes.NOT_MODIFIED and stale is not None:
+            with _CACHE_GUARD:
+                _SERIES_CACHE[key] = stale
+            return stale
+        response.raise_for_status()
+
+        # orjson + one bulk [N, 2] conversion: no per-entry Python loop over
+        # what can be a multi-MB payload for long minutely windows
+        raw = orjson.loads(response.content).get("prices") or []
+        if raw:
+            arr = np.asarray(raw, dtype=np.float64)
+            timestamps_ms = arr[:, 0].astype(np.int64)
+            prices = np.ascontiguousarray(arr[:, 1])
+        else:
+            timestamps_ms = np.empty(0, dtype=np.int64)
+            prices = np.empty(0, dtype=np.float64)
+        # the cached series is handed out to every caller without copying,
+        # so freeze the arrays instead of copying defensively
+        timestamps_ms.flags.writeable = False
+        prices.flags.writeable = False
+        series = PriceSeries(timestamps_ms=timestamps_ms, prices=prices)
+
+        with _CACHE_GUARD:
+            _SERIES_CACHE[key] = series
+        _VALIDATORS[key] = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        _LAST_SERIES[key] = series
+        return series
@@ -0,0 +1,218 @@
+"""LLM-backed analysis of recent ETH price action."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Protocol, Tuple
+
+from openai import APIConnectionError, RateLimitError
+
+from ..providers.openai_provider import (
+    DEFAULT_MODEL,
+    GenerationConfig,
+    LLMProvider,
+    OpenAIProvider,
+)
+from .coingecko import CoinGeckoETHDataSource, PricePoint, PriceSeries
+
+
+class PriceDataSource(Protocol):
+    """Anything that yields a price window.
+
+    The returned series may be a shared cache entry; the analyzer reads it
+    in place and never copies or mutates it.
+    """
+
+    def fetch_price_points(self) -> PriceSeries: ...
+
+SYSTEM_PROMPT = (
+    "You are a market analyst. Summarise the supplied ETH/USD price data in a "
+    "few short paragraphs: overall trend, notable swings, and current level. "
+    "Do not give investment advice."
+)
+
+# fallback text is built from pre-baked pieces: this path fires repeatedly
+# when the endpoint degrades under quota exhaustion, so keep it allocation-flat
+_HEADLINE_RL = "⚠️ OpenAI quota exhausted ({error}); showing raw numbers instead.".format
+_HEADLINE_OFFLINE = "Offline summary (LLM unavailable: {error}).".format
+_ADVISORY = "提示：在 Google Colab 中运行时请先设置 OPENAI_API_KEY，配额恢复后即可重新生成 AI 总结。"
+_FALLBACK_STATS = (
+    "\nCurrent price: ${current:,.2f}\n"
+    "Window high: ${high:,.2f}\n"
+    "Window low: ${low:,.2f}\n"
+    "Change over window: {change:+.2f}%\n\n"
+    "Most recent observations:"
+).format
+_POINT_LINE = "- {p.timestamp:%Y-%m-%d %H:%M} UTC: ${p.price:,.2f}".format
+
+# how long to skip OpenAI after a 429 when the server sends no Retry-After
+_RATE_LIMIT_TTL_SECONDS = 30.0
+
+
+def _rate_limit_backoff(exc: RateLimitError) -> float:
+    """Seconds to back off for, honouring the server's Retry-After if sent."""
+    response = getattr(exc, "response", None)
+    if response is not None:
+        header = response.headers.get("retry-after")
+        if header:
+            try:
+                return float(header)
+            except ValueError:
+                pass
+    return _RATE_LIMIT_TTL_SECONDS
+
+
+@dataclass(frozen=True)
+class AnalysisResult:
+    """Headline numbers plus the generated (or fallback) summary text."""
+
+    current_price: float
+    high: float
+    low: float
+    change_pct: float
+    summary: str
+
+
+class ETHPriceAnalyzer:
+    """Turns a window of ETH price points into a readable market summary."""
+
+    def __init__(
+        self,
+        data_source: Optional[PriceDataSource] = None,
+        provider: Optional[LLMProvider] = None,
+        model: str = DEFAULT_MODEL,
+    ) -> None:
+        self._data_source = data_source if data_source is not None else CoinGeckoETHDataSource()
+        self._provider = provider if provider is not None else OpenAIProvider()
+        self._model = model
+        self._rl_until = 0.0
+
+    def analyze(self) -> AnalysisResult:
+        series = self._data_source.fetch_price_points()
+        stats = self._compute_stats(series)
+        try:
+            summary = self._build_summary(*stats)
+        except (RateLimitError, APIConnectionError) as exc:
+            summary = self._fallback_for(exc, stats)
+        return self._result(stats, summary)
+
+    async def analyze_async(self) -> AnalysisResult:
+        """Like :meth:`analyze`, but awaits the provider so concurrent
+        callers can be coalesced by a batching provider."""
+        series = await asyncio.to_thread(self._data_source.fetch_price_points)
+        stats = self._compute_stats(series)
+        try:
+            summary = await self._build_summary_async(*stats)
+        except (RateLimitError, APIConnectionError) as exc:
+            summary = self._fallback_for(exc, stats)
+        return self._result(stats, summary)
+
+    _Stats = Tuple[float, float, float, float, List[PricePoint]]
+
+    @staticmethod
+    def _compute_stats(series: PriceSeries) -> "_Stats":
+        if len(series) == 0:
+            raise ValueError("data source returned no price points")
+        prices = series.prices
+        current = float(prices[-1])
+        high = float(prices.max())
+        low = float(prices.min())
+        change_pct = float((prices[-1] - prices[0]) / prices[0] * 100)
+        # only the points shown in the prompt are materialised as objects
+        return current, high, low, change_pct, series.tail(6)
+
+    def _fallback_for(self, exc: Exception, stats: "_Stats") -> str:
+        reason = "rate_limit" if isinstance(exc, RateLimitError) else "offline"
+        return self._build_fallback_summary(
+            *stats, reason=reason, error_message=str(exc)
+        )
+
+    @staticmethod
+    def _result(stats: "_Stats", summary: str) -> AnalysisResult:
+        current, high, low, change_pct, _ = stats
+        return AnalysisResult(
+            current_price=current, high=high, low=low,
+            change_pct=change_pct, summary=summary,
+        )
+
+    def _build_summary(
+        self,
+        current: float,
+        high: float,
+        low: float,
+        change_pct: float,
+        recent_points: List[PricePoint],
+    ) -> str:
+        # negative cache: after a 429, don't burn quota (or ~500 ms of
+        # latency) re-asking until the backoff window has passed
+        if time.monotonic() < self._rl_until:
+            return self._build_fallback_summary(
+                current, high, low, change_pct, recent_points,
+                reason="rate_limit", error_message="cached 429",
+            )
+        user_prompt = self._summary_prompt(current, high, low, change_pct, recent_points)
+        config = GenerationConfig(model=self._model, temperature=0.3)
+        try:
+            return self._provider.generate(SYSTEM_PROMPT, user_prompt, config=config)
+        except RateLimitError as exc:
+            self._rl_until = time.monotonic() + _rate_limit_backoff(exc)
+            raise
+
+    async def _build_summary_async(
+        self,
+        current: float,
+        high: float,
+        low: float,
+        change_pct: float,
+        recent_points: List[PricePoint],
+    ) -> str:
+        if time.monotonic() < self._rl_until:
+            return self._build_fallback_summary(
+                current, high, low, change_pct, recent_points,
+                reason="rate_limit", error_message="cached 429",
+            )
+        user_prompt = self._summary_prompt(current, high, low, change_pct, recent_points)
+        config = GenerationConfig(model=self._model, temperature=0.3)
+        try:
+            return await self._provider.generate_async(SYSTEM_PROMPT, user_prompt, config=config)
+        except RateLimitError as exc:
+            self._rl_until = time.monotonic() + _rate_limit_backoff(exc)
+            raise
+
+    @staticmethod
+    def _summary_prompt(
+        current: float,
+        high: float,
+        low: float,
+        change_pct: float,
+        recent_points: List[PricePoint],
+    ) -> str:
+        recent_lines = "\n".join(
+            f"- {p.timestamp:%Y-%m-%d %H:%M} UTC: ${p.price:,.2f}" for p in recent_points
+        )
+        return (
+            f"Current price: ${current:,.2f}\n"
+            f"Window high: ${high:,.2f}\n"
+            f"Window low: ${low:,.2f}\n"
+            f"Change over window: {change_pct:+.2f}%\n"
+            f"Most recent observations:\n{recent_lines}"
+        )
+
+    def _build_fallback_summary(
+        self,
+        current: float,
+        high: float,
+        low: float,
+        change_pct: float,
+        recent_points: List[PricePoint],
+        reason: str,
+        error_message: str,
+    ) -> str:
+        headline_tmpl = _HEADLINE_RL if reason == "rate_limit" else _HEADLINE_OFFLINE
+        return "\n".join((
+            headline_tmpl(error=error_message),
+            _FALLBACK_STATS(current=current, high=high, low=low, change=change_pct),
+            *(_POINT_LINE(p=p) for p in recent_points),
+            "",
+            _ADVISORY,
+        ))
@@ -0,0 +1,4 @@
+from .batching import BatchingLLMProvider
+from .openai_provider import GenerationConfig, LLMProvider, OpenAIProvider
+
+__all__ = ["BatchingLLMProvider", "GenerationConfig", "LLMProvider", "OpenAIProvider"]
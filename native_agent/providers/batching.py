@@ -0,0 +1,92 @@
+"""Micro-batching wrapper that coalesces concurrent LLM calls.
+
+Each caller awaits its own result, but calls that arrive within a short
+window are dispatched together, amortising per-request network latency
+across the batch without pushing tail latency past ``max_wait``.
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from .openai_provider import GenerationConfig, OpenAIProvider
+
+_QueueItem = Tuple[str, str, GenerationConfig, "asyncio.Future[str]"]
+
+
+class BatchingLLMProvider:
+    """Coalesces concurrent ``generate`` calls into homogeneous batches.
+
+    Requests are grouped by their :class:`GenerationConfig` so every
+    dispatch shares model and sampling parameters, then issued in
+    parallel with :func:`asyncio.gather`.
+    """
+
+    def __init__(
+        self,
+        provider: OpenAIProvider,
+        max_batch_size: int = 8,
+        max_wait: float = 0.03,
+    ) -> None:
+        self._provider = provider
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._queue: "asyncio.Queue[_QueueItem]" = asyncio.Queue()
+        self._worker: Optional["asyncio.Task[None]"] = None
+
+    def generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        config: GenerationConfig = GenerationConfig(),
+    ) -> str:
+        """Sync pass-through for callers outside an event loop (e.g. the CLI)."""
+        return self._provider.generate(system_prompt, user_prompt, config=config)
+
+    async def generate_async(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        config: GenerationConfig = GenerationConfig(),
+    ) -> str:
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._dispatch_loop())
+        future: "asyncio.Future[str]" = loop.create_future()
+        await self._queue.put((system_prompt, user_prompt, config, future))
+        return await future
+
+    async def _dispatch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[_QueueItem] = [await self._queue.get()]
+            deadline = loop.time() + self._max_wait
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            await self._dispatch(batch)
+
+    async def _dispatch(self, batch: List[_QueueItem]) -> None:
+        groups: Dict[GenerationConfig, List[_QueueItem]] = defaultdict(list)
+        for item in batch:
+            groups[item[2]].append(item)
+        for config, group in groups.items():
+            results = await asyncio.gather(
+                *[
+                    self._provider.generate_async(system, user, config=config)
+                    for system, user, _, _ in group
+                ],
+                return_exceptions=True,
+            )
+            for (_, _, _, future), result in zip(group, results):
+                if future.cancelled():
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
@@ -0,0 +1,95 @@
+"""OpenAI-backed text generation provider."""
+
+from dataclasses import dataclass
+from typing import Optional, Protocol, Tuple
+
+from openai import AsyncOpenAI, OpenAI
+
+from .. import DEFAULT_MODEL
+
+# one client pair per process: each OpenAI client owns an httpx connection
+# pool, so sharing it keeps TLS sessions alive across requests
+_shared_clients: Optional[Tuple[OpenAI, AsyncOpenAI]] = None
+
+
+def _get_shared_clients() -> Tuple[OpenAI, AsyncOpenAI]:
+    global _shared_clients
+    if _shared_clients is None:
+        _shared_clients = (OpenAI(), AsyncOpenAI())
+    return _shared_clients
+
+
+@dataclass(frozen=True)
+class GenerationConfig:
+    """Sampling parameters for a single generation call."""
+
+    model: str = DEFAULT_MODEL
+    temperature: float = 0.7
+    max_tokens: int = 512
+
+
+class LLMProvider(Protocol):
+    """Anything that can turn a prompt pair into text, sync or async."""
+
+    def generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        config: GenerationConfig = GenerationConfig(),
+    ) -> str: ...
+
+    async def generate_async(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        config: GenerationConfig = GenerationConfig(),
+    ) -> str: ...
+
+
+class OpenAIProvider:
+    """Thin wrapper over the OpenAI chat completions API."""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        organization: Optional[str] = None,
+    ) -> None:
+        if api_key is None and organization is None:
+            self._client, self._async_client = _get_shared_clients()
+        else:
+            self._client = OpenAI(api_key=api_key, organization=organization)
+            self._async_client = AsyncOpenAI(api_key=api_key, organization=organization)
+
+    def generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        config: GenerationConfig = GenerationConfig(),
+    ) -> str:
+        response = self._client.chat.completions.create(
+            model=config.model,
+            temperature=config.temperature,
+            max_tokens=config.max_tokens,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+        )
+        return response.choices[0].message.content or ""
+
+    async def generate_async(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        config: GenerationConfig = GenerationConfig(),
+    ) -> str:
+        response = await self._async_client.chat.completions.create(
+            model=config.model,
+            temperature=config.temperature,
+            max_tokens=config.max_tokens,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+        )
+        return response.choices[0].message.content or ""
@@ -0,0 +1,88 @@
+"""Rewrites a message into a requested style via an LLM provider."""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+from .providers.openai_provider import (
+    DEFAULT_MODEL,
+    GenerationConfig,
+    LLMProvider,
+    OpenAIProvider,
+)
+
+BASE_SYSTEM_PROMPT = (
+    "You are an expert copy editor. Rewrite the user's message without "
+    "changing its meaning or inventing new facts."
+)
+
+STYLE_INSTRUCTIONS = {
+    "professional": "Use a polished, businesslike tone suitable for workplace communication.",
+    "casual": "Use a relaxed, conversational tone.",
+    "friendly": "Use a warm, approachable tone.",
+    "concise": "Be as brief as possible while keeping the full meaning.",
+}
+
+# per-style system prompts and the user-prompt template are baked once at
+# import so the per-request path only appends the dynamic parts
+_SYSTEM_PROMPTS = {
+    style: f"{BASE_SYSTEM_PROMPT} Style: {instructions}"
+    for style, instructions in STYLE_INSTRUCTIONS.items()
+}
+
+_USER_TMPL = (
+    "Rewrite the following text. Output only the rewritten text, "
+    "no explanations.\n\nText: {t}"
+).format
+
+
+# production traffic uses a small set of (style, extras) pairs and models,
+# so the specialised prompt and config are built once per combination
+@lru_cache(maxsize=128)
+def _make_system_prompt(style: str, extras: Optional[str]) -> str:
+    base = _SYSTEM_PROMPTS.get(style, _SYSTEM_PROMPTS["professional"])
+    return f"{base} {extras}" if extras else base
+
+
+@lru_cache(maxsize=8)
+def _make_config(model: str) -> GenerationConfig:
+    return GenerationConfig(model=model)
+
+
+@dataclass(frozen=True)
+class RewriteRequest:
+    """A single rewrite job."""
+
+    text: str
+    style: str = "professional"
+    extra_instructions: Optional[str] = None
+
+
+class MessageRewriter:
+    """Applies a style rewrite to arbitrary text through the provider."""
+
+    def __init__(
+        self,
+        provider: Optional[LLMProvider] = None,
+        model: str = DEFAULT_MODEL,
+    ) -> None:
+        self._provider = provider if provider is not None else OpenAIProvider()
+        self._model = model
+
+    def rewrite(self, request: RewriteRequest) -> str:
+        system_prompt = _make_system_prompt(
+            request.style.lower(), request.extra_instructions
+        )
+        return self._provider.generate(
+            system_prompt, _USER_TMPL(t=request.text), config=_make_config(self._model)
+        )
+
+    async def rewrite_async(self, request: RewriteRequest) -> str:
+        """Like :meth:`rewrite`, but awaits the provider so concurrent
+        callers can be coalesced by a batching provider."""
+        system_prompt = _make_system_prompt(
+            request.style.lower(), request.extra_instructions
+        )
+        return await self._provider.generate_async(
+            system_prompt, _USER_TMPL(t=request.text), config=_make_config(self._model)
+        )
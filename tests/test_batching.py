@@ -0,0 +1,87 @@
+import asyncio
+
+from native_agent.providers.batching import BatchingLLMProvider
+from native_agent.providers.openai_provider import GenerationConfig
+
+
+class RecordingProvider:
+    """Stub provider that records how calls are dispatched."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+
+    def generate(self, system_prompt, user_prompt, config=GenerationConfig()):
+        return f"sync:{user_prompt}"
+
+    async def generate_async(self, system_prompt, user_prompt, config=GenerationConfig()):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return f"{config.model}:{user_prompt}"
+
+
+class FlakyProvider(RecordingProvider):
+    async def generate_async(self, system_prompt, user_prompt, config=GenerationConfig()):
+        if "boom" in user_prompt:
+            raise RuntimeError("boom")
+        return await super().generate_async(system_prompt, user_prompt, config=config)
+
+
+def test_single_call_round_trips():
+    batcher = BatchingLLMProvider(RecordingProvider(), max_wait=0.01)
+
+    async def run():
+        return await batcher.generate_async("sys", "hello")
+
+    assert asyncio.run(run()) == "gpt-4o-mini:hello"
+
+
+def test_sync_generate_passes_through():
+    batcher = BatchingLLMProvider(RecordingProvider())
+    assert batcher.generate("sys", "hello") == "sync:hello"
+
+
+def test_concurrent_calls_overlap_in_one_batch():
+    provider = RecordingProvider()
+    batcher = BatchingLLMProvider(provider, max_batch_size=4, max_wait=0.05)
+
+    async def run():
+        return await asyncio.gather(
+            *[batcher.generate_async("sys", f"p{i}") for i in range(4)]
+        )
+
+    assert asyncio.run(run()) == [f"gpt-4o-mini:p{i}" for i in range(4)]
+    # the whole batch was in flight at once, not serialised
+    assert provider.max_active > 1
+
+
+def test_each_config_gets_its_own_group():
+    batcher = BatchingLLMProvider(RecordingProvider(), max_batch_size=4, max_wait=0.05)
+    fast = GenerationConfig(model="fast")
+    slow = GenerationConfig(model="slow")
+
+    async def run():
+        return await asyncio.gather(
+            batcher.generate_async("sys", "a", config=fast),
+            batcher.generate_async("sys", "b", config=slow),
+            batcher.generate_async("sys", "c", config=fast),
+        )
+
+    assert asyncio.run(run()) == ["fast:a", "slow:b", "fast:c"]
+
+
+def test_provider_errors_reach_only_their_caller():
+    batcher = BatchingLLMProvider(FlakyProvider(), max_batch_size=2, max_wait=0.05)
+
+    async def run():
+        return await asyncio.gather(
+            batcher.generate_async("sys", "boom"),
+            batcher.generate_async("sys", "fine"),
+            return_exceptions=True,
+        )
+
+    failed, ok = asyncio.run(run())
+    assert isinstance(failed, RuntimeError)
+    assert ok == "gpt-4o-mini:fine"